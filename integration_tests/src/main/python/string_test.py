@@ -24,66 +24,102 @@ from pyspark.sql.types import *
 import pyspark.sql.functions as f
 from spark_session import is_databricks104_or_later
 
-_regexp_conf = { 'spark.rapids.sql.regexp.enabled': 'true' }
-
 def mk_str_gen(pattern):
     return StringGen(pattern).with_special_case('').with_special_pattern('.{0,10}')
 
+# Each of these tests splits on a plain literal delimiter so they should all run on the GPU
+# even when regular expression support is disabled, proving that the non-regex split
+# kernel is used. The plan capture guards against accidentally falling back to the CPU
+# or routing literal delimiters through the regex code path.
+_literal_split_conf = { 'spark.rapids.sql.regexp.enabled': 'false' }
+
 def test_split_no_limit():
     data_gen = mk_str_gen('([ABC]{0,3}_?){0,7}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark : unary_op_df(spark, data_gen).selectExpr(
                 'split(a, "AB")',
                 'split(a, "C")',
                 'split(a, "_")'),
-                conf=_regexp_conf)
+                exist_classes='GpuStringSplit',
+                conf=_literal_split_conf)
 
 def test_split_negative_limit():
     data_gen = mk_str_gen('([ABC]{0,3}_?){0,7}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
         lambda spark : unary_op_df(spark, data_gen).selectExpr(
             'split(a, "AB", -1)',
             'split(a, "C", -2)',
             'split(a, "_", -999)'),
-            conf=_regexp_conf)
+            exist_classes='GpuStringSplit',
+            conf=_literal_split_conf)
 
 def test_split_zero_limit():
     data_gen = mk_str_gen('([ABC]{0,3}_?){0,7}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
         lambda spark : unary_op_df(spark, data_gen).selectExpr(
             'split(a, "AB", 0)',
             'split(a, "C", 0)',
             'split(a, "_", 0)'),
-        conf=_regexp_conf)
+        exist_classes='GpuStringSplit',
+        conf=_literal_split_conf)
 
 def test_split_one_limit():
     data_gen = mk_str_gen('([ABC]{0,3}_?){1,7}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
         lambda spark : unary_op_df(spark, data_gen).selectExpr(
             'split(a, "AB", 1)',
             'split(a, "C", 1)',
             'split(a, "_", 1)'),
-        conf=_regexp_conf)
+        exist_classes='GpuStringSplit',
+        conf=_literal_split_conf)
 
 def test_split_positive_limit():
     data_gen = mk_str_gen('([ABC]{0,3}_?){0,7}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
         lambda spark : unary_op_df(spark, data_gen).selectExpr(
             'split(a, "AB", 2)',
             'split(a, "C", 3)',
-            'split(a, "_", 999)'))
+            'split(a, "_", 999)'),
+        exist_classes='GpuStringSplit',
+        conf=_literal_split_conf)
+
+def test_split_getitem_fused():
+    data_gen = mk_str_gen('([ABC]{0,3}_?){0,7}')
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+        lambda spark : unary_op_df(spark, data_gen).selectExpr(
+            'split(a, "_")[0]',
+            'split(a, "_")[2]',
+            'split(a, "AB")[1]',
+            'split(a, "[C]")[1]'),
+        exist_classes='GpuStringSplitPart',
+        conf={'spark.rapids.sql.regexp.enabled': 'true'})
+
+def test_split_getitem_not_fused():
+    data_gen = mk_str_gen('([ABC]{0,3}_?){0,7}')
+    # with a positive split limit the requested element may be the unsplit remainder,
+    # so the split and the lookup have to stay separate
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+        lambda spark : unary_op_df(spark, data_gen).selectExpr(
+            'split(a, "_", 2)[0]',
+            'split(a, "_", 2)[1]'),
+        exist_classes='GpuStringSplit',
+        non_exist_classes='GpuStringSplitPart',
+        conf=_literal_split_conf)
 
 @pytest.mark.parametrize('data_gen,delim', [(mk_str_gen('([ABC]{0,3}_?){0,7}'), '_'),
     (mk_str_gen('([MNP_]{0,3}\\.?){0,5}'), '.'),
-    (mk_str_gen('([123]{0,3}\\^?){0,5}'), '^')], ids=idfn)
+    (mk_str_gen('([123]{0,3}\\^?){0,5}'), '^'),
+    # long strings stress the fast non-regex path used for counts of 1 and -1
+    (mk_str_gen('([a-z]{10,40}_?){10,25}'), '_')], ids=idfn)
 def test_substring_index(data_gen,delim):
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark : unary_op_df(spark, data_gen).select(
                 f.substring_index(f.col('a'), delim, 1),
                 f.substring_index(f.col('a'), delim, 3),
                 f.substring_index(f.col('a'), delim, 0),
                 f.substring_index(f.col('a'), delim, -1),
-                f.substring_index(f.col('a'), delim, -4)))
+                f.substring_index(f.col('a'), delim, -4)),
+            exist_classes='GpuSubstringIndex')
 
 # ONLY LITERAL WIDTH AND PAD ARE SUPPORTED
 def test_lpad():
@@ -110,13 +146,14 @@ def test_rpad():
 # ONLY LITERAL SEARCH PARAMS ARE SUPPORTED
 def test_position():
     gen = mk_str_gen('.{0,3}Z_Z.{0,3}A.{0,3}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark: unary_op_df(spark, gen).selectExpr(
                 'POSITION(NULL IN a)',
                 'POSITION("Z_" IN a)',
                 'POSITION("" IN a)',
                 'POSITION("_" IN a)',
-                'POSITION("A" IN a)'))
+                'POSITION("A" IN a)'),
+            exist_classes='GpuStringLocate')
 
 def test_locate():
     gen = mk_str_gen('.{0,3}Z_Z.{0,3}A.{0,3}')
@@ -129,54 +166,65 @@ def test_locate():
 
 def test_instr():
     gen = mk_str_gen('.{0,3}Z_Z.{0,3}A.{0,3}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark: unary_op_df(spark, gen).selectExpr(
                 'instr(a, "Z")',
                 'instr(a, "A")',
                 'instr(a, "_")',
                 'instr(a, NULL)',
                 'instr(NULL, "A")',
-                'instr(NULL, NULL)'))
+                'instr(NULL, NULL)'),
+            exist_classes='GpuStringInstr')
 
 def test_contains():
     gen = mk_str_gen('.{0,3}Z?_Z?.{0,3}A?.{0,3}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark: unary_op_df(spark, gen).select(
                 f.col('a').contains('Z'),
                 f.col('a').contains('Z_'),
                 f.col('a').contains(''),
                 f.col('a').contains(None)
-                ))
+                ),
+            exist_classes='GpuContains')
 
+# All the trim variants map to the cudf strip kernels, which take the characters to
+# remove as a plain set, so they should stay on the GPU even with regular expression
+# support disabled
 def test_trim():
     gen = mk_str_gen('[Ab \ud720]{0,3}A.{0,3}Z[ Ab]{0,3}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark: unary_op_df(spark, gen).selectExpr(
                 'TRIM(a)',
                 'TRIM("Ab" FROM a)',
                 'TRIM("A\ud720" FROM a)',
                 'TRIM(BOTH NULL FROM a)',
-                'TRIM("" FROM a)'))
+                'TRIM("" FROM a)'),
+            exist_classes='GpuStringTrim',
+            conf={'spark.rapids.sql.regexp.enabled': 'false'})
 
 def test_ltrim():
     gen = mk_str_gen('[Ab \ud720]{0,3}A.{0,3}Z[ Ab]{0,3}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark: unary_op_df(spark, gen).selectExpr(
                 'LTRIM(a)',
                 'LTRIM("Ab", a)',
                 'TRIM(LEADING "A\ud720" FROM a)',
                 'TRIM(LEADING NULL FROM a)',
-                'TRIM(LEADING "" FROM a)'))
+                'TRIM(LEADING "" FROM a)'),
+            exist_classes='GpuStringTrimLeft',
+            conf={'spark.rapids.sql.regexp.enabled': 'false'})
 
 def test_rtrim():
     gen = mk_str_gen('[Ab \ud720]{0,3}A.{0,3}Z[ Ab]{0,3}')
-    assert_gpu_and_cpu_are_equal_collect(
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
             lambda spark: unary_op_df(spark, gen).selectExpr(
                 'RTRIM(a)',
                 'RTRIM("Ab", a)',
                 'TRIM(TRAILING "A\ud720" FROM a)',
                 'TRIM(TRAILING NULL FROM a)',
-                'TRIM(TRAILING "" FROM a)'))
+                'TRIM(TRAILING "" FROM a)'),
+            exist_classes='GpuStringTrimRight',
+            conf={'spark.rapids.sql.regexp.enabled': 'false'})
 
 def test_startswith():
     gen = mk_str_gen('[Ab\ud720]{3}A.{0,3}Z[Ab\ud720]{3}')
@@ -197,24 +245,41 @@ def test_endswith():
                 f.col('a').endswith(None),
                 f.col('a').endswith('A\ud720')))
 
+# The needles here are pure ASCII and the rows are long, exercising the optimized
+# single-pass search paths in the cudf kernels rather than the short rows the other
+# search tests mostly generate
+def test_contains_startswith_endswith_long_strings():
+    gen = StringGen('[a-z0-9 ]{100,300}Z_Z[a-z0-9 ]{100,300}')
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+            lambda spark: unary_op_df(spark, gen).select(
+                f.col('a').contains('Z_Z'),
+                f.col('a').contains('0 1'),
+                f.col('a').startswith('a0'),
+                f.col('a').endswith('9z')),
+            exist_classes='GpuContains,GpuStartsWith,GpuEndsWith')
+
 def test_concat_ws_basic():
     gen = StringGen(nullable=True)
     (s1, s2) = gen_scalars(gen, 2, force_no_nulls=True)
-    assert_gpu_and_cpu_are_equal_collect(
-            lambda spark: binary_op_df(spark, gen).select(
-                f.concat_ws("-"),
-                f.concat_ws("-", f.col('a')),
-                f.concat_ws(None, f.col('a')),
-                f.concat_ws("-", f.col('a'), f.col('b')),
-                f.concat_ws("-", f.col('a'), f.lit('')),
-                f.concat_ws("*", f.col('a'), f.col('b'), f.col('a')),
-                f.concat_ws("*", s1, f.col('b')),
-                f.concat_ws("+", f.col('a'), s2),
-                f.concat_ws("-", f.lit(None), f.lit(None)),
-                f.concat_ws("-", f.lit(None).cast('string'), f.col('b')),
-                f.concat_ws("+", f.col('a'), f.lit(None).cast('string')),
-                f.concat_ws(None, f.col('a'), f.col('b')),
-                f.concat_ws("+", f.col('a'), f.lit(''))))
+    # all of the variadic forms below concatenate their inputs in a single
+    # stringConcatenate kernel call, so the whole projection must stay on the GPU
+    exprs = [
+        f.concat_ws("-"),
+        f.concat_ws("-", f.col('a')),
+        f.concat_ws(None, f.col('a')),
+        f.concat_ws("-", f.col('a'), f.col('b')),
+        f.concat_ws("-", f.col('a'), f.lit('')),
+        f.concat_ws("*", f.col('a'), f.col('b'), f.col('a')),
+        f.concat_ws("*", s1, f.col('b')),
+        f.concat_ws("+", f.col('a'), s2),
+        f.concat_ws("-", f.lit(None), f.lit(None)),
+        f.concat_ws("-", f.lit(None).cast('string'), f.col('b')),
+        f.concat_ws("+", f.col('a'), f.lit(None).cast('string')),
+        f.concat_ws(None, f.col('a'), f.col('b')),
+        f.concat_ws("+", f.col('a'), f.lit(''))]
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+            lambda spark: binary_op_df(spark, gen).select(*exprs),
+            exist_classes='GpuConcatWs')
 
 def test_concat_ws_arrays():
     gen = ArrayGen(StringGen(nullable=True), nullable=True)
@@ -256,6 +321,18 @@ def test_concat_ws_sql_basic():
                 'concat_ws("=", b, \'\', \'bbb\', \'zzz\'), ' +
                 'concat_ws("*", b, a, cast(null as string)) from concat_ws_table')
 
+def test_concat_ws_sql_many_batches():
+    gen = StringGen(nullable=True)
+    # a tiny batch size forces the result to come back as many small string batches,
+    # exercising the coalesce/concatenate path on the collect side
+    assert_gpu_and_cpu_are_equal_sql(
+            lambda spark: binary_op_df(spark, gen, length=4096),
+            'concat_ws_table',
+            'select ' +
+                'concat_ws("-", a, b), ' +
+                'concat_ws("*", b, a, cast(null as string)) from concat_ws_table',
+            conf={'spark.rapids.sql.batchSizeBytes': '8192'})
+
 def test_concat_ws_sql_col_sep():
     gen = StringGen(nullable=True)
     sep = StringGen('[-,*,+,!]', nullable=True)
@@ -324,59 +401,106 @@ def test_concat_ws_sql_arrays_all_null_col_sep():
                 'concat_ws(c, a, array(null), b, array()), ' +
                 'concat_ws(c, b, b, array(b)) from concat_ws_table')
 
-def test_substring():
+# ONLY LITERAL POSITION AND LENGTH ARE SUPPORTED
+def test_overlay():
+    gen = mk_str_gen('.{0,10}')
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+            lambda spark: unary_op_df(spark, gen).selectExpr(
+                'overlay(a placing "TEST" from 1)',
+                'overlay(a placing "TEST" from 5)',
+                'overlay(a placing "TEST" from 1 for 0)',
+                'overlay(a placing "TEST" from 2 for 3)',
+                'overlay(a placing "TEST" from 7 for 100)',
+                'overlay(a placing "" from 3)',
+                'overlay(a placing a from 2)',
+                'overlay(a placing a from 2 for 1)',
+                'overlay("1234567890" placing a from 3)'),
+            exist_classes='GpuOverlay')
+
+@allow_non_gpu('ProjectExec', 'Alias', 'Overlay')
+def test_overlay_zero_position_fallback():
+    gen = mk_str_gen('.{0,10}')
+    assert_gpu_fallback_collect(
+            lambda spark: unary_op_df(spark, gen).selectExpr(
+                'overlay(a placing "TEST" from 0)'),
+            'Overlay')
+
+# Boundary cases for the start and length arguments of SUBSTRING, kept as data so
+# the wide projections below are generated instead of spelled out expression by
+# expression. A length of None exercises the two-argument form.
+_substring_literal_args = [
+    ('1', '5'),
+    ('5', '2147483647'),
+    ('5', '-2147483648'),
+    ('1', None),
+    ('-3', None),
+    ('3', '-2'),
+    ('100', None),
+    ('-100', None),
+    ('NULL', None),
+    ('1', 'NULL'),
+    ('-5', '0'),
+    ('-5', '4'),
+    ('10', '0'),
+    ('-50', '10'),
+    ('-10', '-1'),
+    ('0', '10'),
+    ('0', '0')]
+
+# the same for the column start/length variants, against both a column and a
+# literal input string
+_substring_column_args = [
+    ('b', 'c'),
+    ('b', '0'),
+    ('b', '5'),
+    ('b', '-5'),
+    ('b', '100'),
+    ('b', '-100'),
+    ('b', 'NULL'),
+    ('0', 'c'),
+    ('5', 'c'),
+    ('-5', 'c'),
+    ('100', 'c'),
+    ('-100', 'c'),
+    ('NULL', 'c'),
+    ('b', None)]
+
+_substring_literal_str_args = [
+    ('b', 'c'),
+    ('1', 'c'),
+    ('0', 'c'),
+    ('5', 'c'),
+    ('-1', 'c'),
+    ('-5', 'c'),
+    ('NULL', 'c'),
+    ('b', '10'),
+    ('b', '-10'),
+    ('b', '2'),
+    ('b', '0'),
+    ('b', 'NULL'),
+    ('b', None)]
+
+def _substring_exprs(str_arg, arg_table):
+    return ['SUBSTRING({}, {})'.format(str_arg, ', '.join(a for a in args if a is not None))
+            for args in arg_table]
+
+# This is a wide projection over a single input column, so also run it through the
+# tiered projection path, which factors out and batches the shared sub-expressions
+# rather than evaluating each of the outputs completely independently
+@pytest.mark.parametrize('tiered_project_enabled', ['true', 'false'])
+def test_substring(tiered_project_enabled):
     gen = mk_str_gen('.{0,30}')
     assert_gpu_and_cpu_are_equal_collect(
             lambda spark: unary_op_df(spark, gen).selectExpr(
-                'SUBSTRING(a, 1, 5)',
-                'SUBSTRING(a, 5, 2147483647)',
-                'SUBSTRING(a, 5, -2147483648)',
-                'SUBSTRING(a, 1)',
-                'SUBSTRING(a, -3)',
-                'SUBSTRING(a, 3, -2)',
-                'SUBSTRING(a, 100)',
-                'SUBSTRING(a, -100)',
-                'SUBSTRING(a, NULL)',
-                'SUBSTRING(a, 1, NULL)',
-                'SUBSTRING(a, -5, 0)',
-                'SUBSTRING(a, -5, 4)',
-                'SUBSTRING(a, 10, 0)',
-                'SUBSTRING(a, -50, 10)',
-                'SUBSTRING(a, -10, -1)',
-                'SUBSTRING(a, 0, 10)',
-                'SUBSTRING(a, 0, 0)'))
+                *_substring_exprs('a', _substring_literal_args)),
+            conf={'spark.rapids.sql.tiered.project.enabled': tiered_project_enabled})
 
 def test_substring_column():
     str_gen = mk_str_gen('.{0,30}')
     assert_gpu_and_cpu_are_equal_collect(
         lambda spark: three_col_df(spark, str_gen, int_gen, int_gen).selectExpr(
-            'SUBSTRING(a, b, c)',
-            'SUBSTRING(a, b, 0)',
-            'SUBSTRING(a, b, 5)',
-            'SUBSTRING(a, b, -5)',
-            'SUBSTRING(a, b, 100)',
-            'SUBSTRING(a, b, -100)',
-            'SUBSTRING(a, b, NULL)',
-            'SUBSTRING(a, 0, c)',
-            'SUBSTRING(a, 5, c)',
-            'SUBSTRING(a, -5, c)',
-            'SUBSTRING(a, 100, c)',
-            'SUBSTRING(a, -100, c)',
-            'SUBSTRING(a, NULL, c)',
-            'SUBSTRING(\'abc\', b, c)',
-            'SUBSTRING(\'abc\', 1, c)',
-            'SUBSTRING(\'abc\', 0, c)',
-            'SUBSTRING(\'abc\', 5, c)',
-            'SUBSTRING(\'abc\', -1, c)',
-            'SUBSTRING(\'abc\', -5, c)',
-            'SUBSTRING(\'abc\', NULL, c)',
-            'SUBSTRING(\'abc\', b, 10)',
-            'SUBSTRING(\'abc\', b, -10)',
-            'SUBSTRING(\'abc\', b, 2)',
-            'SUBSTRING(\'abc\', b, 0)',
-            'SUBSTRING(\'abc\', b, NULL)',
-            'SUBSTRING(\'abc\', b)',
-            'SUBSTRING(a, b)'))
+            *(_substring_exprs('a', _substring_column_args) +
+                _substring_exprs('\'abc\'', _substring_literal_str_args))))
 
 @pytest.mark.skipif(is_databricks_runtime() and not is_databricks104_or_later(),
                     reason="https://github.com/NVIDIA/spark-rapids/issues/7463")
@@ -413,6 +537,16 @@ def test_repeat_null_column_and_scalar():
                 'repeat(a, 10)'
             ))
 
+# Long inputs and a large repeat count make the output chars buffer orders of
+# magnitude bigger than the input, stressing the output-size computation and
+# allocation in the repeat kernel rather than just its per-row logic
+def test_repeat_long_strings():
+    gen_s = StringGen('[a-z]{100,300}', nullable=True)
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+            lambda spark: unary_op_df(spark, gen_s).selectExpr(
+                'repeat(a, 50)'),
+            exist_classes='GpuStringRepeat')
+
 def test_repeat_column_and_column():
     gen_s = StringGen(nullable=True)
     gen_r = IntegerGen(min_val=-100, max_val=100, special_cases=[0], nullable=True)
@@ -484,25 +618,48 @@ def test_like():
             .with_special_case('12345678')\
             .with_special_case('12345678901234')\
             .with_special_case('%SystemDrive%\\Users\\John')
+    patterns = [
+        '%o%', # turned into contains
+        '%a%', # turned into contains
+        '', #turned into equals
+        '12345678', #turned into equals
+        '\\%SystemDrive\\%\\\\Users%',
+        '_',
+        '_oo_',
+        '_oo%',
+        '%oo_',
+        '_\u201c%',
+        '_a[d]%',
+        '_a(d)%',
+        '_$',
+        '_$%',
+        '_._',
+        '_?|}{_%',
+        '%a{3}%']
     assert_gpu_and_cpu_are_equal_collect(
             lambda spark: unary_op_df(spark, gen).select(
-                f.col('a').like('%o%'), # turned into contains
-                f.col('a').like('%a%'), # turned into contains
-                f.col('a').like(''), #turned into equals
-                f.col('a').like('12345678'), #turned into equals
-                f.col('a').like('\\%SystemDrive\\%\\\\Users%'),
-                f.col('a').like('_'),
-                f.col('a').like('_oo_'),
-                f.col('a').like('_oo%'),
-                f.col('a').like('%oo_'),
-                f.col('a').like('_\u201c%'),
-                f.col('a').like('_a[d]%'),
-                f.col('a').like('_a(d)%'),
-                f.col('a').like('_$'),
-                f.col('a').like('_$%'),
-                f.col('a').like('_._'),
-                f.col('a').like('_?|}{_%'),
-                f.col('a').like('%a{3}%'))) 
+                *[f.col('a').like(p) for p in patterns]))
+
+def test_like_simplified_to_contains_startswith_endswith():
+    gen = mk_str_gen('(\u20ac|\\w){0,3}a[|b*.$\r\n]{0,2}c\\w{0,3}')\
+            .with_special_pattern('\\w{0,3}oo\\w{0,3}', weight=100.0)\
+            .with_special_case('oo%')\
+            .with_special_case('%oo')\
+            .with_special_case('100%')\
+            .with_special_case('')
+    # Spark's LikeSimplification rule skips any pattern that contains the escape
+    # character, so every pattern below embeds one to prove the plugin itself rewrites
+    # each shape to the much cheaper contains/startsWith/endsWith/equality kernels
+    # instead of the LIKE matcher
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+            lambda spark: unary_op_df(spark, gen).selectExpr(
+                'a like "%oo^%%" escape "^"', # contains "oo%"
+                'a like "oo^%%" escape "^"', # startswith "oo%"
+                'a like "100^%%" escape "^"', # startswith "100%"
+                'a like "%^%oo" escape "^"', # endswith "%oo"
+                'a like "oo^%" escape "^"', # equals "oo%"
+                'a like "%" escape "^"'), # only wildcards, contains ""
+            exist_classes='GpuContains,GpuStartsWith,GpuEndsWith,GpuEqualTo')
 
 def test_like_simple_escape():
     gen = mk_str_gen('(\u20ac|\\w){0,3}a[|b*.$\r\n]{0,2}c\\w{0,3}')\
@@ -546,4 +703,21 @@ def test_like_complex_escape():
                 'a like "\\%SystemDrive\\%\\\\\\\\Users%"',
                 'a like "_oo"'),
             conf={'spark.sql.parser.escapedStringLiterals': 'true'})
- 
+
+def test_like_hex_literal_simplified():
+    gen = mk_str_gen('(\u20ac|\\w){0,3}a[|b*.$\r\n]{0,2}c\\w{0,3}')\
+            .with_special_pattern('\\w{0,3}oo\\w{0,3}', weight=100.0)\
+            .with_special_case('oo%moo')\
+            .with_special_case('')
+    # Hex string literals decode to plain pattern strings during parsing, so
+    # wildcard-only patterns written as x "..." still get rewritten at plan time
+    # to the literal-compare kernels instead of running the generic LIKE matcher
+    assert_cpu_and_gpu_are_equal_collect_with_capture(
+            lambda spark: unary_op_df(spark, gen).selectExpr(
+                'a like x "256f6f25"', # %oo%
+                'a like x "6f6f25"', # oo%
+                'a like x "256f6f"', # %oo
+                'a like x "256f6f232525" escape "#"'), # %oo#%% -> contains "oo%"
+            exist_classes='GpuContains,GpuStartsWith,GpuEndsWith',
+            conf={'spark.sql.parser.escapedStringLiterals': 'true'})
+
@@ -2418,7 +2418,19 @@ object GpuOverrides extends Logging {
         ("ordinal", TypeSig.INT, TypeSig.INT)),
       (in, conf, p, r) => new BinaryExprMeta[GetArrayItem](in, conf, p, r) {
         override def convertToGpu(arr: Expression, ordinal: Expression): GpuExpression =
-          GpuGetArrayItem(arr, ordinal, in.failOnError)
+          (arr, ordinal) match {
+            // Selecting a single element of an unlimited split only needs the split to
+            // produce enough pieces to reach that element, so fuse the two and skip
+            // materializing the full list column. An ANSI-mode lookup still needs the
+            // real element count to know when to throw, so it is not fused.
+            case (split @ GpuStringSplit(_, _, GpuLiteral(limit: Int, _), _, _),
+                GpuLiteral(index: Int, IntegerType))
+                if !in.failOnError && index >= 0 && limit <= 0 =>
+              GpuStringSplitPart(split.str, split.regex, split.limit, split.pattern,
+                split.isRegExp, index)
+            case _ =>
+              GpuGetArrayItem(arr, ordinal, in.failOnError)
+          }
       }),
     expr[GetMapValue](
       "Gets Value from a Map based on a key",
@@ -3045,10 +3057,19 @@ object GpuOverrides extends Logging {
       ExprChecks.binaryProject(TypeSig.BOOLEAN, TypeSig.BOOLEAN,
         ("src", TypeSig.STRING, TypeSig.STRING),
         ("search", TypeSig.lit(TypeEnum.STRING), TypeSig.STRING)),
-      (a, conf, p, r) => new BinaryExprMeta[Like](a, conf, p, r) {
-        override def convertToGpu(lhs: Expression, rhs: Expression): GpuExpression =
-          GpuLike(lhs, rhs, a.escapeChar)
-      }),
+      (a, conf, p, r) => new GpuLikeMeta(a, conf, p, r)),
+    expr[Overlay](
+      "Replace a specified portion of a string with another string",
+      ExprChecks.projectOnly(TypeSig.STRING, TypeSig.STRING + TypeSig.BINARY,
+        Seq(ParamCheck("input", TypeSig.STRING, TypeSig.STRING + TypeSig.BINARY),
+          ParamCheck("replace", TypeSig.STRING, TypeSig.STRING + TypeSig.BINARY),
+          ParamCheck("pos", TypeSig.lit(TypeEnum.INT)
+              .withPsNote(TypeEnum.INT, "only values of 1 or greater are supported"),
+            TypeSig.INT),
+          ParamCheck("len", TypeSig.lit(TypeEnum.INT)
+              .withPsNote(TypeEnum.INT, "only values of -1 or greater are supported"),
+            TypeSig.INT))),
+      (a, conf, p, r) => new GpuOverlayMeta(a, conf, p, r)),
     expr[RLike](
       "Regular expression version of Like",
       ExprChecks.binaryProject(TypeSig.BOOLEAN, TypeSig.BOOLEAN,
@@ -26,7 +26,7 @@ import com.nvidia.spark.rapids._
 import com.nvidia.spark.rapids.RapidsPluginImplicits._
 import com.nvidia.spark.rapids.shims.{ShimExpression, SparkShimImpl}
 
-import org.apache.spark.sql.catalyst.expressions.{ExpectsInputTypes, Expression, ImplicitCastInputTypes, InputFileName, Literal, NullIntolerant, Predicate, RegExpExtract, RegExpExtractAll, RLike, StringSplit, StringToMap, SubstringIndex, TernaryExpression}
+import org.apache.spark.sql.catalyst.expressions.{ExpectsInputTypes, Expression, ImplicitCastInputTypes, InputFileName, Like, Literal, NullIntolerant, Overlay, Predicate, RegExpExtract, RegExpExtractAll, RLike, StringSplit, StringToMap, SubstringIndex, TernaryExpression}
 import org.apache.spark.sql.types._
 import org.apache.spark.sql.vectorized.ColumnarBatch
 import org.apache.spark.unsafe.types.UTF8String
@@ -183,6 +183,24 @@ case class GpuStringLocate(substr: Expression, col: Expression, start: Expressio
         throw new UnsupportedOperationException(s"Cannot columnar evaluate expression: $this")
 }
 
+object GpuStringSearch extends Arm {
+  def isEmptySearch(search: GpuScalar): Boolean =
+    search.isValid && search.getValue.asInstanceOf[UTF8String].numChars() == 0
+
+  /**
+   * An empty search string trivially matches every non-null row, so answer from the
+   * validity mask without scanning any character data. Null rows stay null to match
+   * Spark's null propagation.
+   */
+  def emptySearchResult(strs: GpuColumnVector): ColumnVector = {
+    withResource(Scalar.fromBool(true)) { trueScalar =>
+      withResource(ColumnVector.fromScalar(trueScalar, strs.getRowCount.toInt)) { allTrue =>
+        allTrue.mergeAndSetValidity(BinaryOp.BITWISE_AND, strs.getBase)
+      }
+    }
+  }
+}
+
 case class GpuStartsWith(left: Expression, right: Expression)
   extends GpuBinaryExpression with Predicate with ImplicitCastInputTypes with NullIntolerant {
 
@@ -197,7 +215,11 @@ case class GpuStartsWith(left: Expression, right: Expression)
   override def toString: String = s"gpustartswith($left, $right)"
 
   def doColumnar(lhs: GpuColumnVector, rhs: GpuScalar): ColumnVector =
-    lhs.getBase.startsWith(rhs.getBase)
+    if (GpuStringSearch.isEmptySearch(rhs)) {
+      GpuStringSearch.emptySearchResult(lhs)
+    } else {
+      lhs.getBase.startsWith(rhs.getBase)
+    }
 
   override def doColumnar(numRows: Int, lhs: GpuScalar, rhs: GpuScalar): ColumnVector = {
     withResource(GpuColumnVector.from(lhs, numRows, left.dataType)) { expandedLhs =>
@@ -228,7 +250,11 @@ case class GpuEndsWith(left: Expression, right: Expression)
   override def toString: String = s"gpuendswith($left, $right)"
 
   def doColumnar(lhs: GpuColumnVector, rhs: GpuScalar): ColumnVector =
-    lhs.getBase.endsWith(rhs.getBase)
+    if (GpuStringSearch.isEmptySearch(rhs)) {
+      GpuStringSearch.emptySearchResult(lhs)
+    } else {
+      lhs.getBase.endsWith(rhs.getBase)
+    }
 
   override def doColumnar(numRows: Int, lhs: GpuScalar, rhs: GpuScalar): ColumnVector = {
     withResource(GpuColumnVector.from(lhs, numRows, left.dataType)) { expandedLhs =>
@@ -428,7 +454,11 @@ case class GpuContains(left: Expression, right: Expression) extends GpuBinaryExp
   override def toString: String = s"gpucontains($left, $right)"
 
   def doColumnar(lhs: GpuColumnVector, rhs: GpuScalar): ColumnVector =
-    lhs.getBase.stringContains(rhs.getBase)
+    if (GpuStringSearch.isEmptySearch(rhs)) {
+      GpuStringSearch.emptySearchResult(lhs)
+    } else {
+      lhs.getBase.stringContains(rhs.getBase)
+    }
 
   override def doColumnar(numRows: Int, lhs: GpuScalar, rhs: GpuScalar): ColumnVector = {
     withResource(GpuColumnVector.from(lhs, numRows, left.dataType)) { expandedLhs =>
@@ -742,6 +772,112 @@ case class GpuStringRepeat(input: Expression, repeatTimes: Expression)
 
 }
 
+class GpuOverlayMeta(
+    expr: Overlay,
+    conf: RapidsConf,
+    parent: Option[RapidsMeta[_, _, _]],
+    rule: DataFromReplacementRule)
+  extends QuaternaryExprMeta[Overlay](expr, conf, parent, rule) {
+
+  override def tagExprForGpu(): Unit = {
+    GpuOverrides.extractLit(expr.pos) match {
+      case Some(Literal(pos: Int, _)) if pos >= 1 =>
+      case _ => willNotWorkOnGpu("only a literal position of 1 or greater is supported")
+    }
+    GpuOverrides.extractLit(expr.len) match {
+      case Some(Literal(len: Int, _)) if len >= -1 =>
+      case _ => willNotWorkOnGpu("only a literal length of -1 or greater is supported")
+    }
+  }
+
+  override def convertToGpu(input: Expression, replace: Expression,
+      pos: Expression, len: Expression): GpuExpression =
+    GpuOverlay(input, replace, pos, len)
+}
+
+/**
+ * Replace the `len` characters of `input` starting at the 1-based position `pos` with
+ * `replace`. The result is built as prefix ++ replace ++ suffix with plain substring and
+ * concatenate kernels. A length of -1 (the default in Spark's parser) means the number
+ * of characters actually inserted, which can vary by row when the replacement is a
+ * column, so in that case the suffix start positions are computed per row.
+ */
+case class GpuOverlay(input: Expression, replace: Expression, pos: Expression, len: Expression)
+  extends GpuExpression with ShimExpression with ImplicitCastInputTypes {
+
+  override def dataType: DataType = StringType
+  override def inputTypes: Seq[AbstractDataType] =
+    Seq(StringType, StringType, IntegerType, IntegerType)
+  override def children: Seq[Expression] = Seq(input, replace, pos, len)
+  override def nullable: Boolean = children.exists(_.nullable)
+  override def foldable: Boolean = children.forall(_.foldable)
+  override def prettyName: String = "overlay"
+
+  override def columnarEval(batch: ColumnarBatch): Any = {
+    withResource(GpuExpressionsUtils.columnarEvalToColumn(input, batch)) { inputCol =>
+      withResource(GpuExpressionsUtils.columnarEvalToColumn(replace, batch)) { replaceCol =>
+        withResourceIfAllowed(pos.columnarEval(batch)) {
+          case posScalar: GpuScalar =>
+            withResourceIfAllowed(len.columnarEval(batch)) {
+              case lenScalar: GpuScalar =>
+                doOverlay(inputCol.getBase, replaceCol.getBase, posScalar, lenScalar,
+                  batch.numRows())
+              case other =>
+                throw new IllegalStateException(s"Only literal lengths are supported, found $other")
+            }
+          case other =>
+            throw new IllegalStateException(s"Only literal positions are supported, found $other")
+        }
+      }
+    }
+  }
+
+  private def doOverlay(input: ColumnView, replace: ColumnView, pos: GpuScalar,
+      len: GpuScalar, numRows: Int): GpuColumnVector = {
+    if (!pos.isValid || !len.isValid) {
+      return GpuColumnVector.fromNull(numRows, dataType)
+    }
+    val position = pos.getValue.asInstanceOf[Int]
+    val length = len.getValue.asInstanceOf[Int]
+    withResource(input.substring(0, position - 1)) { prefix =>
+      val suffix = if (length >= 0) {
+        val suffixStart = math.min(position.toLong - 1 + length, Int.MaxValue.toLong).toInt
+        input.substring(suffixStart)
+      } else {
+        val starts = withResource(replace.getCharLengths) { replaceLens =>
+          withResource(Scalar.fromInt(position - 1)) { offset =>
+            replaceLens.add(offset, DType.INT32)
+          }
+        }
+        withResource(starts) { _ =>
+          substringFrom(input, starts)
+        }
+      }
+      withResource(suffix) { _ =>
+        // any null among the three pieces (and so any null input or replacement) nulls
+        // out the row, matching Spark's null handling
+        GpuColumnVector.from(ColumnVector.stringConcatenate(
+          Array[ColumnView](prefix, replace, suffix)), dataType)
+      }
+    }
+  }
+
+  private def substringFrom(strs: ColumnView, starts: ColumnView): ColumnVector = {
+    val ends = withResource(Scalar.fromInt(Int.MaxValue)) { maxInt =>
+      ColumnVector.fromScalar(maxInt, starts.getRowCount.toInt)
+    }
+    withResource(ends) { _ =>
+      // cudf does not allow nulls in the start positions. Rows where the start is null
+      // have a null replacement and are nulled out by the final concatenate anyway.
+      val noNullStarts = new ColumnView(starts.getType, starts.getRowCount, Optional.of(0L),
+        starts.getData, null)
+      withResource(noNullStarts) { _ =>
+        strs.substring(noNullStarts, ends)
+      }
+    }
+  }
+}
+
 trait HasGpuStringReplace extends Arm {
   def doStringReplace(
       strExpr: GpuColumnVector,
@@ -857,6 +993,85 @@ object CudfRegexp {
   }
 }
 
+class GpuLikeMeta(
+    expr: Like,
+    conf: RapidsConf,
+    parent: Option[RapidsMeta[_, _, _]],
+    rule: DataFromReplacementRule) extends BinaryExprMeta[Like](expr, conf, parent, rule) {
+
+  override def convertToGpu(lhs: Expression, rhs: Expression): GpuExpression = {
+    val simplified = expr.right match {
+      case Literal(str: UTF8String, DataTypes.StringType) if str != null =>
+        GpuLike.simplify(lhs, str.toString, expr.escapeChar)
+      case _ => None
+    }
+    simplified.getOrElse(GpuLike(lhs, rhs, expr.escapeChar))
+  }
+}
+
+object GpuLike {
+  /**
+   * Attempt to rewrite a LIKE pattern made up of a single run of literal characters,
+   * optionally surrounded by `%` wildcards, into a cheaper string operation:
+   * `%lit%` becomes contains, `lit%` becomes startsWith, `%lit` becomes endsWith and
+   * a pattern with no wildcards at all becomes an equality check. Spark's own
+   * LikeSimplification rule already does this on the CPU, but skips any pattern
+   * that contains the escape character, so patterns with escaped wildcards would
+   * otherwise always pay for the full LIKE kernel. Returns None for anything more
+   * complex, including any use of the `_` wildcard.
+   */
+  def simplify(input: Expression, pattern: String, escapeChar: Char): Option[GpuExpression] = {
+    val literal = new StringBuilder
+    var leadingWildcard = false
+    var trailingWildcard = false
+    var i = 0
+    while (i < pattern.length) {
+      pattern.charAt(i) match {
+        case `escapeChar` =>
+          if (i + 1 >= pattern.length) {
+            // malformed pattern, let the LIKE kernel deal with it
+            return None
+          }
+          val escaped = pattern.charAt(i + 1)
+          if (escaped != '_' && escaped != '%' && escaped != escapeChar) {
+            return None
+          }
+          if (trailingWildcard) {
+            // a second literal run, such as "a%b"
+            return None
+          }
+          literal.append(escaped)
+          i += 2
+        case '_' =>
+          return None
+        case '%' =>
+          if (literal.isEmpty) {
+            leadingWildcard = true
+          } else {
+            trailingWildcard = true
+          }
+          i += 1
+        case c =>
+          if (trailingWildcard) {
+            // a second literal run, such as "a%b"
+            return None
+          }
+          literal.append(c)
+          i += 1
+      }
+    }
+    val lit = GpuLiteral(literal.toString, StringType)
+    (leadingWildcard, trailingWildcard) match {
+      case (true, true) => Some(GpuContains(input, lit))
+      case (false, true) => Some(GpuStartsWith(input, lit))
+      case (true, false) if literal.nonEmpty => Some(GpuEndsWith(input, lit))
+      // the pattern was nothing but wildcards, which matches any non-null string
+      case (true, false) => Some(GpuContains(input, lit))
+      case (false, false) => Some(GpuEqualTo(input, lit))
+    }
+  }
+}
+
 case class GpuLike(left: Expression, right: Expression, escapeChar: Char)
   extends GpuBinaryExpression with ImplicitCastInputTypes with NullIntolerant  {
 
@@ -1623,8 +1838,20 @@ case class GpuSubstringIndex(strExpr: Expression,
         }
       }
     } else {
-      withResource(str.getBase.extractRe(new RegexProgram(regexp))) { table: Table =>
-        table.getColumn(0).incRefCount()
+      count.getValue.asInstanceOf[Int] match {
+        case c @ (1 | -1) =>
+          // A count of 1 (or -1) selects everything before the first (or after the last)
+          // delimiter, which is just the first (or last) element of a literal split. Splitting
+          // on the literal delimiter avoids spinning up the much slower regex kernel for the
+          // most common case.
+          val delimStr = delim.getValue.asInstanceOf[UTF8String].toString
+          withResource(str.getBase.stringSplitRecord(delimStr, -1)) { split =>
+            split.extractListElement(if (c > 0) 0 else -1)
+          }
+        case _ =>
+          withResource(str.getBase.extractRe(new RegexProgram(regexp))) { table: Table =>
+            table.getColumn(0).incRefCount()
+          }
       }
     }
   }
@@ -1942,6 +2169,89 @@ case class GpuStringSplit(str: Expression, regex: Expression, limit: Expression,
     throw new IllegalStateException("This is not supported yet")
 }
 
+/**
+ * A fusion of `split(str, delim)[index]` for a literal non-negative index and an
+ * unlimited split. Instead of materializing the full list column only to throw away
+ * everything but one element per row, split with just enough output columns to cover
+ * the requested index and keep that single column.
+ */
+case class GpuStringSplitPart(str: Expression, regex: Expression, limit: Expression,
+    pattern: String, isRegExp: Boolean, index: Int)
+  extends GpuTernaryExpression with ImplicitCastInputTypes {
+
+  override def dataType: DataType = StringType
+  override def inputTypes: Seq[DataType] = Seq(StringType, StringType, IntegerType)
+  override def first: Expression = str
+  override def second: Expression = regex
+  override def third: Expression = limit
+  override def nullable: Boolean = true
+
+  override def prettyName: String = "split_part"
+
+  override def doColumnar(str: GpuColumnVector, regex: GpuScalar,
+      limit: GpuScalar): ColumnVector = {
+    // Splitting with a limit of index + 2 guarantees that column `index`, when present,
+    // holds a complete piece rather than the unsplit remainder, and matches the value
+    // the full split would have produced at that position.
+    val table = if (isRegExp) {
+      str.getBase.stringSplit(new RegexProgram(pattern, CaptureGroups.NON_CAPTURE), index + 2)
+    } else {
+      str.getBase.stringSplit(pattern, index + 2)
+    }
+    withResource(table) { table =>
+      if (index < table.getNumberOfColumns) {
+        table.getColumn(index).incRefCount()
+      } else {
+        // no row split into enough pieces to reach the index
+        GpuColumnVector.columnVectorFromNull(str.getRowCount.toInt, StringType)
+      }
+    }
+  }
+
+  override def doColumnar(numRows: Int, val0: GpuScalar, val1: GpuScalar,
+      val2: GpuScalar): ColumnVector = {
+    withResource(GpuColumnVector.from(val0, numRows, str.dataType)) { val0Col =>
+      doColumnar(val0Col, val1, val2)
+    }
+  }
+
+  override def doColumnar(
+      str: GpuColumnVector,
+      regex: GpuColumnVector,
+      limit: GpuColumnVector): ColumnVector =
+    throw new IllegalStateException("This is not supported yet")
+
+  override def doColumnar(
+      str: GpuScalar,
+      regex: GpuColumnVector,
+      limit: GpuColumnVector): ColumnVector =
+    throw new IllegalStateException("This is not supported yet")
+
+  override def doColumnar(
+      str: GpuScalar,
+      regex: GpuScalar,
+      limit: GpuColumnVector): ColumnVector =
+    throw new IllegalStateException("This is not supported yet")
+
+  override def doColumnar(
+      str: GpuScalar,
+      regex: GpuColumnVector,
+      limit: GpuScalar): ColumnVector =
+    throw new IllegalStateException("This is not supported yet")
+
+  override def doColumnar(
+      str: GpuColumnVector,
+      regex: GpuScalar,
+      limit: GpuColumnVector): ColumnVector =
+    throw new IllegalStateException("This is not supported yet")
+
+  override def doColumnar(
+      str: GpuColumnVector,
+      regex: GpuColumnVector,
+      limit: GpuScalar): ColumnVector =
+    throw new IllegalStateException("This is not supported yet")
+}
+
 class GpuStringToMapMeta(expr: StringToMap,
                          conf: RapidsConf,
                          parent: Option[RapidsMeta[_, _, _]],